@@ -1,55 +1,89 @@
-from typing import List, Dict
-from enum import Enum
+from typing import List, Dict, Iterable, Optional, Tuple
+from collections import defaultdict
+from enum import IntEnum
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from array import array
 import random
+import sys
+import threading
 
 # ------------------ ENUMS ------------------ #
-class SeatType(Enum):
-    GOLD = "gold"
-    PREMIUM = "premium"
+class SeatType(IntEnum):
+    GOLD = 0
+    PREMIUM = 1
 
-class SeatStatus(Enum):
-    BOOKED = "booked"
-    AVAILABLE = "available"
+# AVAILABLE is the only truthy status, so `if seat.status` means "is available"
+class SeatStatus(IntEnum):
+    BOOKED = 0
+    AVAILABLE = 1
+
+# Display strings indexed by member value, so rendering a seat skips the enum name lookup
+_SEAT_TYPE_LABELS = tuple(member.name.lower() for member in SeatType)
+_SEAT_STATUS_NAMES = tuple(member.name for member in SeatStatus)
+
+# ------------------ EXCEPTIONS ------------------ #
+class SeatConflictError(Exception):
+    pass
+
+# ------------------ HELPERS ------------------ #
+def _intern(value):
+    # Registry keys are interned so lookups can match on identity; only str can be interned
+    return sys.intern(value) if type(value) is str else value
 
 # ------------------ USERS ------------------ #
 class User:
+    __slots__ = ("id", "name", "contact_no")
+
     def __init__(self, id: str, name: str, contact_no: str):
         self.id = id
         self.name = name
         self.contact_no = contact_no
 
 class Admin(User):
+    __slots__ = ("shows", "movies")
+
     def __init__(self, id: str, name: str, contact_no: str):
         super().__init__(id, name, contact_no)
-        self.shows: List["Show"] = []
-        self.movies: List["Movies"] = []
+        self.shows: Dict[str, "Show"] = {}
+        self.movies: Dict[str, "Movies"] = {}
 
     def add_show(self, show: "Show"):
-        self.shows.append(show)
+        show.id = _intern(show.id)
+        self.shows[show.id] = show
 
     def remove_show(self, show: "Show"):
-        self.shows.remove(show)
+        del self.shows[show.id]
 
     def add_movie(self, movie: "Movies"):
-        self.movies.append(movie)
+        movie.id = _intern(movie.id)
+        self.movies[movie.id] = movie
 
     def remove_movie(self, movie: "Movies"):
-        self.movies.remove(movie)
+        del self.movies[movie.id]
 
 class Customer(User):
+    __slots__ = ("bookings",)
+
     def __init__(self, id: str, name: str, contact_no: str):
         super().__init__(id, name, contact_no)
         self.bookings: Dict[str, "Booking"] = {}
 
     def create_booking(self, booking: "Booking"):
+        booking.id = _intern(booking.id)
         self.bookings[booking.id] = booking
 
+    def bulk_book(self, bookings: Iterable["Booking"]):
+        batch: Dict[str, "Booking"] = {}
+        for booking in bookings:
+            booking.id = _intern(booking.id)
+            batch[booking.id] = booking
+        self.bookings.update(batch)
+
     def cancel_booking(self, booking_id: str):
         if booking_id in self.bookings:
             booking = self.bookings[booking_id]
-            for seat in booking.seats:
-                seat.status = SeatStatus.AVAILABLE
+            booking.show.release(booking.seat_indices, booking.bitmap)
             del self.bookings[booking_id]
             print(f"❎ Booking {booking_id} has been cancelled.")
         else:
@@ -66,40 +100,39 @@ class UserFactory:
         else:
             raise ValueError("Invalid user type")
 
-# ------------------ STRATEGY ------------------ #
-class PricingStrategy(ABC):
-    @abstractmethod
-    def get_price(self, base_price: float) -> float:
-        pass
-
-class GoldPricingStrategy(PricingStrategy):
-    def get_price(self, base_price: float) -> float:
-        return base_price * 1.5
-
-class PremiumPricingStrategy(PricingStrategy):
-    def get_price(self, base_price: float) -> float:
-        return base_price * 2
+# ------------------ PRICING ------------------ #
+PRICE_MULTIPLIERS: Dict[SeatType, float] = {
+    SeatType.GOLD: 1.5,
+    SeatType.PREMIUM: 2.0,
+}
 
 # ------------------ PAYMENT SIMULATION ------------------ #
+PAYMENT_SUCCESS_RATE = 0.75
+_rand = random.random
+
 class PaymentGateway:
     @staticmethod
     def process_payment(amount: float) -> bool:
         print(f"💳 Processing payment of ₹{amount:.2f}...")
-        return random.choice([True, True, True, False])
+        return _rand() < PAYMENT_SUCCESS_RATE
 
 # ------------------ BOOKING ------------------ #
 class Booking:
+    __slots__ = ("id", "customer", "show", "seats", "seat_indices", "bitmap", "total_price")
+
     def __init__(self, id: str, customer: Customer, show: "Show", seats: List["Seat"], base_price: float):
         self.id = id
         self.customer = customer
         self.show = show
         self.seats = seats
-        self.total_price = sum(seat.get_price(base_price) for seat in seats)
-        for seat in seats:
-            seat.status = SeatStatus.BOOKED
+        self.seat_indices = show.seat_indices(seats)
+        self.total_price = show.price_of(self.seat_indices, base_price)
+        self.bitmap = show.reserve(self.seat_indices)
 
 # ------------------ MOVIE ------------------ #
 class Movies:
+    __slots__ = ("id", "name", "title", "duration", "genre", "shows")
+
     def __init__(self, id: str, name: str, title: str, duration: int, genre: str, shows: List["Show"]):
         self.id = id
         self.name = name
@@ -110,13 +143,96 @@ class Movies:
 
 # ------------------ BUILDER ------------------ #
 class Show:
+    __slots__ = ("id", "movie_id", "start_time", "end_time", "_seats",
+                 "seat_index", "seat_multipliers", "multiplier_sum", "hold_bits", "_lock")
+
     def __init__(self):
         self.id = None
         self.movie_id = None
         self.start_time = None
         self.end_time = None
+        self._lock = threading.Lock()
         self.seats = None
 
+    @property
+    def seats(self) -> List["Seat"]:
+        return self._seats
+
+    @seats.setter
+    def seats(self, seats: List["Seat"]):
+        # Assigning seats lays out the column-wise copies of the seat data
+        self._seats = seats
+        seats = seats or []
+        # Keyed by identity: seats from other shows may reuse the same seat ids
+        self.seat_index: Dict[int, int] = {id(seat): i for i, seat in enumerate(seats)}
+        self.seat_multipliers = array("d", (PRICE_MULTIPLIERS[seat.seat_type] for seat in seats))
+        # Summed alongside the multipliers so whole-show pricing can never see a stale layout
+        self.multiplier_sum = sum(self.seat_multipliers)
+        # Bit i is set while seat i is held by a booking
+        self.hold_bits = self.seat_mask(
+            [i for i, seat in enumerate(seats) if seat.status == SeatStatus.BOOKED])
+
+    def seat_indices(self, seats: List["Seat"]) -> List[int]:
+        indices = []
+        for seat in seats:
+            i = self.seat_index.get(id(seat))
+            if i is None:
+                raise ValueError(f"Seat {seat.id} is not part of show {self.id}")
+            indices.append(i)
+        # Sorted so every caller visits a show's seats in the same global order
+        indices.sort()
+        return indices
+
+    @staticmethod
+    def seat_mask(indices: List[int]) -> int:
+        # Set bits in a little-endian byte buffer and convert once; OR-ing 1 << i into a
+        # growing int would reallocate the whole bitmap for every index
+        if not indices:
+            return 0
+        buf = bytearray((max(indices) >> 3) + 1)
+        for i in indices:
+            buf[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(buf, "little")
+
+    @staticmethod
+    def bit_indices(bits: int) -> List[int]:
+        # bin() renders the bitmap in one pass; reversed, character i is bit i
+        return [i for i, bit in enumerate(bin(bits)[:1:-1]) if bit == "1"]
+
+    def available_indices(self) -> List[int]:
+        return self.bit_indices(~self.hold_bits & ((1 << len(self.seats)) - 1))
+
+    def price_of(self, indices: List[int], base_price: float) -> float:
+        return base_price * sum(map(self.seat_multipliers.__getitem__, indices))
+
+    def whole_show_price(self, base_price: float) -> float:
+        # Uses the multiplier sum precomputed when the seats were laid out, so no per-seat work
+        return base_price * self.multiplier_sum
+
+    def reserve(self, indices: List[int]) -> int:
+        # Check and book under one lock so two bookings can never both win the same seat
+        mask = self.seat_mask(indices)
+        with self._lock:
+            conflict = self.hold_bits & mask
+            if conflict:
+                taken = [self.seats[i].id for i in self.bit_indices(conflict)]
+                raise SeatConflictError(f"Seats already booked: {taken}")
+            self.hold_bits |= mask
+            self.set_status(indices, SeatStatus.BOOKED)
+        return mask
+
+    def release(self, indices: List[int], mask: Optional[int] = None):
+        # Bookings pass the mask returned by reserve() so it is not rebuilt on cancel
+        if mask is None:
+            mask = self.seat_mask(indices)
+        with self._lock:
+            self.hold_bits &= ~mask
+            self.set_status(indices, SeatStatus.AVAILABLE)
+
+    def set_status(self, indices: List[int], status: SeatStatus):
+        for i in indices:
+            self.seats[i].status = status
+
 class ShowBuilder(ABC):
     @abstractmethod
     def set_show_id(self, id: str): pass
@@ -150,20 +266,22 @@ class Director:
 
 # ------------------ SEAT ------------------ #
 class Seat:
-    def __init__(self, id: str, row: int, col: int, seat_type: SeatType,
-                 status: SeatStatus, pricing_strategy: PricingStrategy):
+    __slots__ = ("id", "row", "col", "seat_type", "status")
+
+    def __init__(self, id: str, row: int, col: int, seat_type: SeatType, status: SeatStatus):
         self.id = id
         self.row = row
         self.col = col
         self.seat_type = seat_type
         self.status = status
-        self.pricing_strategy = pricing_strategy
 
     def get_price(self, base_price: float) -> float:
-        return self.pricing_strategy.get_price(base_price)
+        return base_price * PRICE_MULTIPLIERS[self.seat_type]
 
 # ------------------ THEATER ------------------ #
 class Address:
+    __slots__ = ("id", "address_line", "city", "state", "pin")
+
     def __init__(self, id: str, address_line: str, city: str, state: str, pin: int):
         self.id = id
         self.address_line = address_line
@@ -172,57 +290,177 @@ class Address:
         self.pin = pin
 
 class Theater:
+    __slots__ = ("id", "shows", "address")
+
     def __init__(self, id: str, shows: List[Show], address: Address):
         self.id = id
         self.shows = shows
         self.address = address
 
 # ------------------ SINGLETON SERVICES ------------------ #
+def _normalize(text: str) -> str:
+    # Search keys are lowered and interned once at ingest, so queries only lower their input
+    return sys.intern(text.lower())
+
 class SingletonMeta(type):
     _instances = {}
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            # setdefault is atomic, so racing first calls all get the instance that won
+            instance = cls._instances.setdefault(cls, super().__call__(*args, **kwargs))
+        return instance
 
 class TheaterService(metaclass=SingletonMeta):
     def __init__(self):
         self.theaters: Dict[str, Theater] = {}
+        self.version = 0
+        self._by_city: Dict[str, List[Theater]] = defaultdict(list)
+        self._by_pin: Dict[int, List[Theater]] = defaultdict(list)
+        # Keys each id was indexed under, so re-adding unindexes it even if its fields changed
+        self._indexed: Dict[str, tuple] = {}
 
     def add_theater(self, theater: Theater):
+        theater.id = _intern(theater.id)
+        self._index(theater, self._keys(theater))
         self.theaters[theater.id] = theater
+        self.version += 1
+
+    def bulk_add(self, theaters: Iterable[Theater]):
+        # Dedupe first so only the last theater per id is indexed, then grow the registry once
+        batch: Dict[str, Theater] = {}
+        for theater in theaters:
+            theater.id = _intern(theater.id)
+            batch[theater.id] = theater
+        # Compute every key before indexing anything, so one bad theater leaves the service untouched
+        keyed = [(theater, self._keys(theater)) for theater in batch.values()]
+        for theater, keys in keyed:
+            self._index(theater, keys)
+        self.theaters.update(batch)
+        self.version += 1
 
-    def search_by_city(self, city: str) -> List[Theater]:
-        return [t for t in self.theaters.values() if t.address.city.lower() == city.lower()]
-
-    def search_by_pin(self, pin: int) -> List[Theater]:
-        return [t for t in self.theaters.values() if t.address.pin == pin]
+    @staticmethod
+    def _keys(theater: Theater) -> tuple:
+        # Computed (and hash-checked) before the indexes are touched, so a bad theater
+        # raises without leaving the previous entry half-removed
+        keys = (_normalize(theater.address.city), theater.address.pin)
+        hash(keys)
+        return keys
+
+    def _index(self, theater: Theater, keys: tuple):
+        city, pin = keys
+        old_keys = self._indexed.get(theater.id)
+        if old_keys is not None:
+            old = self.theaters[theater.id]
+            old_city, old_pin = old_keys
+            self._by_city[old_city].remove(old)
+            self._by_pin[old_pin].remove(old)
+        self._by_city[city].append(theater)
+        self._by_pin[pin].append(theater)
+        self._indexed[theater.id] = (city, pin)
+
+    def search_by_city(self, city: str) -> Tuple[Theater, ...]:
+        return tuple(self._by_city.get(city.lower(), ()))
+
+    def search_by_pin(self, pin: int) -> Tuple[Theater, ...]:
+        return tuple(self._by_pin.get(pin, ()))
 
 class MovieService(metaclass=SingletonMeta):
     def __init__(self):
         self.movies: Dict[str, Movies] = {}
+        self.version = 0
+        self._by_name: Dict[str, List[Movies]] = defaultdict(list)
+        self._by_genre: Dict[str, List[Movies]] = defaultdict(list)
+        self._indexed: Dict[str, tuple] = {}
 
     def add_movie(self, movie: Movies):
+        movie.id = _intern(movie.id)
+        self._index(movie, self._keys(movie))
         self.movies[movie.id] = movie
+        self.version += 1
+
+    def bulk_add(self, movies: Iterable[Movies]):
+        batch: Dict[str, Movies] = {}
+        for movie in movies:
+            movie.id = _intern(movie.id)
+            batch[movie.id] = movie
+        keyed = [(movie, self._keys(movie)) for movie in batch.values()]
+        for movie, keys in keyed:
+            self._index(movie, keys)
+        self.movies.update(batch)
+        self.version += 1
 
-    def search_by_name(self, name: str) -> List[Movies]:
-        return [m for m in self.movies.values() if m.name.lower() == name.lower()]
-
-    def search_by_genre(self, genre: str) -> List[Movies]:
-        return [m for m in self.movies.values() if m.genre.lower() == genre.lower()]
+    @staticmethod
+    def _keys(movie: Movies) -> tuple:
+        return _normalize(movie.name), _normalize(movie.genre)
+
+    def _index(self, movie: Movies, keys: tuple):
+        name, genre = keys
+        old_keys = self._indexed.get(movie.id)
+        if old_keys is not None:
+            old = self.movies[movie.id]
+            old_name, old_genre = old_keys
+            self._by_name[old_name].remove(old)
+            self._by_genre[old_genre].remove(old)
+        self._by_name[name].append(movie)
+        self._by_genre[genre].append(movie)
+        self._indexed[movie.id] = (name, genre)
+
+    def search_by_name(self, name: str) -> Tuple[Movies, ...]:
+        return tuple(self._by_name.get(name.lower(), ()))
+
+    def search_by_genre(self, genre: str) -> Tuple[Movies, ...]:
+        return tuple(self._by_genre.get(genre.lower(), ()))
 
 class ShowService(metaclass=SingletonMeta):
     def __init__(self):
         self.shows: Dict[str, Show] = {}
+        self.version = 0
+        self._by_movie_id: Dict[str, List[Show]] = defaultdict(list)
+        self._by_start_time: Dict[str, List[Show]] = defaultdict(list)
+        self._indexed: Dict[str, tuple] = {}
 
     def add_show(self, show: Show):
+        show.id = _intern(show.id)
+        self._index(show, self._keys(show))
         self.shows[show.id] = show
+        self.version += 1
+
+    def bulk_add(self, shows: Iterable[Show]):
+        batch: Dict[str, Show] = {}
+        for show in shows:
+            show.id = _intern(show.id)
+            batch[show.id] = show
+        keyed = [(show, self._keys(show)) for show in batch.values()]
+        for show, keys in keyed:
+            self._index(show, keys)
+        self.shows.update(batch)
+        self.version += 1
 
-    def search_by_movie(self, movie_id: str) -> List[Show]:
-        return [s for s in self.shows.values() if s.movie_id == movie_id]
-
-    def search_by_time(self, start_time: str) -> List[Show]:
-        return [s for s in self.shows.values() if s.start_time == start_time]
+    @staticmethod
+    def _keys(show: Show) -> tuple:
+        keys = (_intern(show.movie_id), show.start_time)
+        hash(keys)
+        return keys
+
+    def _index(self, show: Show, keys: tuple):
+        movie_id, start_time = keys
+        old_keys = self._indexed.get(show.id)
+        if old_keys is not None:
+            old = self.shows[show.id]
+            old_movie_id, old_start_time = old_keys
+            self._by_movie_id[old_movie_id].remove(old)
+            self._by_start_time[old_start_time].remove(old)
+        show.movie_id = movie_id
+        self._by_movie_id[movie_id].append(show)
+        self._by_start_time[start_time].append(show)
+        self._indexed[show.id] = (movie_id, start_time)
+
+    def search_by_movie(self, movie_id: str) -> Tuple[Show, ...]:
+        return tuple(self._by_movie_id.get(movie_id, ()))
+
+    def search_by_time(self, start_time: str) -> Tuple[Show, ...]:
+        return tuple(self._by_start_time.get(start_time, ()))
 
 # ------------------ FACADE ------------------ #
 class SearchFacade:
@@ -230,34 +468,50 @@ class SearchFacade:
         self.movie_service = movie_service
         self.show_service = show_service
         self.theater_service = theater_service
+        self._cached_search = lru_cache(maxsize=256)(self._run_search)
 
     def search_movies_by_name(self, name: str):
-        return self.movie_service.search_by_name(name)
+        return self._search(self.movie_service, "search_by_name", name)
 
     def search_movies_by_genre(self, genre: str):
-        return self.movie_service.search_by_genre(genre)
+        return self._search(self.movie_service, "search_by_genre", genre)
 
     def search_shows_by_movie(self, movie_id: str):
-        return self.show_service.search_by_movie(movie_id)
+        return self._search(self.show_service, "search_by_movie", movie_id)
 
     def search_shows_by_time(self, start_time: str):
-        return self.show_service.search_by_time(start_time)
+        return self._search(self.show_service, "search_by_time", start_time)
 
     def search_theaters_by_city(self, city: str):
-        return self.theater_service.search_by_city(city)
+        return self._search(self.theater_service, "search_by_city", city)
 
     def search_theaters_by_pin(self, pin: int):
-        return self.theater_service.search_by_pin(pin)
+        return self._search(self.theater_service, "search_by_pin", pin)
+
+    def _search(self, service, method: str, query):
+        # The service version is part of the cache key, so any add_* call invalidates older results
+        return self._cached_search(service, method, query, service.version)
+
+    @staticmethod
+    def _run_search(service, method: str, query, version: int) -> tuple:
+        # Services already return immutable tuples, so the result is cached as-is
+        return getattr(service, method)(query)
 
 # ------------------ MAIN ------------------ #
+_SEAT_ROW = "  💺 Seat {id}: {type} - ₹{price:.2f}, Status: {status}".format
+
+def _flush(out: List[str]):
+    sys.stdout.write("\n".join(out) + "\n")
+    out.clear()
+
 def main():
     # Setup
     admin = UserFactory.create_user("admin", "A1", "AdminUser", "1234567890")
     customer = UserFactory.create_user("customer", "C1", "CustomerUser", "9876543210")
 
     seats = [
-        Seat("S1", 1, 1, SeatType.GOLD, SeatStatus.AVAILABLE, GoldPricingStrategy()),
-        Seat("S2", 1, 2, SeatType.PREMIUM, SeatStatus.AVAILABLE, PremiumPricingStrategy()),
+        Seat("S1", 1, 1, SeatType.GOLD, SeatStatus.AVAILABLE),
+        Seat("S2", 1, 2, SeatType.PREMIUM, SeatStatus.AVAILABLE),
     ]
 
     builder = MovieShowBuilder()
@@ -276,50 +530,57 @@ def main():
 
     facade = SearchFacade(movie_service, show_service, theater_service)
 
-    print("🔍 Searching for movie by name 'Inception'")
+    # Output is collected and written in batches; flush before calls that print on their own
+    out: List[str] = []
+
+    out.append("🔍 Searching for movie by name 'Inception'")
     for m in facade.search_movies_by_name("Inception"):
-        print(f"🎬 Movie: {m.title}, Genre: {m.genre}, Duration: {m.duration} mins")
+        out.append(f"🎬 Movie: {m.title}, Genre: {m.genre}, Duration: {m.duration} mins")
 
-    print("\n⏰ Searching shows by start time '10:00'")
+    out.append("\n⏰ Searching shows by start time '10:00'")
     for s in facade.search_shows_by_time("10:00"):
-        print(f"🎟️ Show ID: {s.id}, Start Time: {s.start_time}, End Time: {s.end_time}")
-        for seat in s.seats:
-            print(f"  💺 Seat {seat.id}: {seat.seat_type.value} - ₹{seat.get_price(200):.2f}, Status: {seat.status.name}")
+        out.append(f"🎟️ Show ID: {s.id}, Start Time: {s.start_time}, End Time: {s.end_time}")
+        out.extend([_SEAT_ROW(id=seat.id, type=_SEAT_TYPE_LABELS[seat.seat_type],
+                              price=seat.get_price(200), status=_SEAT_STATUS_NAMES[seat.status])
+                    for seat in s.seats])
 
-    print("\n🏢 Searching theaters in 'Gotham'")
+    out.append("\n🏢 Searching theaters in 'Gotham'")
     for t in facade.search_theaters_by_city("Gotham"):
-        print(f"🎭 Theater ID: {t.id}, Address: {t.address.address_line}, City: {t.address.city}")
+        out.append(f"🎭 Theater ID: {t.id}, Address: {t.address.address_line}, City: {t.address.city}")
 
     # Booking
     base_price = 200.0
-    print("\n🧾 Customer trying to book an available seat...")
+    out.append("\n🧾 Customer trying to book an available seat...")
 
-    available_seats = [seat for seat in show.seats if seat.status == SeatStatus.AVAILABLE]
-    if available_seats:
-        selected_seats = [available_seats[0]]
-        total_price = sum(seat.get_price(base_price) for seat in selected_seats)
+    available = show.available_indices()
+    if available:
+        selected_seats = [show.seats[available[0]]]
+        total_price = show.price_of(available[:1], base_price)
 
+        _flush(out)
         if PaymentGateway.process_payment(total_price):
             booking = Booking("B1", customer, show, selected_seats, base_price)
             customer.create_booking(booking)
-            print(f"✅ Booking Successful! Booking ID: {booking.id}")
-            print(f"   🎫 Seats Booked: {[seat.id for seat in booking.seats]}")
-            print(f"   💰 Total Price: ₹{booking.total_price:.2f}")
+            out.append(f"✅ Booking Successful! Booking ID: {booking.id}")
+            out.append(f"   🎫 Seats Booked: {[seat.id for seat in booking.seats]}")
+            out.append(f"   💰 Total Price: ₹{booking.total_price:.2f}")
         else:
-            print("❌ Payment failed. Booking not completed.")
+            out.append("❌ Payment failed. Booking not completed.")
     else:
-        print("❌ No available seats to book.")
+        out.append("❌ No available seats to book.")
 
-    print("\n📄 Customer Booking History:")
+    out.append("\n📄 Customer Booking History:")
     for b_id, b in customer.bookings.items():
-        print(f"🆔 {b_id} | Show: {b.show.id} | Seats: {[s.id for s in b.seats]} | Total: ₹{b.total_price:.2f}")
+        out.append(f"🆔 {b_id} | Show: {b.show.id} | Seats: {[s.id for s in b.seats]} | Total: ₹{b.total_price:.2f}")
 
-    print("\n🔄 Cancelling booking 'B1'...")
+    out.append("\n🔄 Cancelling booking 'B1'...")
+    _flush(out)
     customer.cancel_booking("B1")
 
-    print("\n📄 Updated Booking History:")
+    out.append("\n📄 Updated Booking History:")
     for b_id, b in customer.bookings.items():
-        print(f"🆔 {b_id} | Show: {b.show.id} | Seats: {[s.id for s in b.seats]} | Total: ₹{b.total_price:.2f}")
+        out.append(f"🆔 {b_id} | Show: {b.show.id} | Seats: {[s.id for s in b.seats]} | Total: ₹{b.total_price:.2f}")
+    _flush(out)
 
 if __name__ == "__main__":
     main()